@@ -15,19 +15,21 @@ versucht `/status`, einen vorhandenen Token zu laden und zu verifizieren.
 
 from __future__ import annotations
 
-import json
 import os
 import secrets
 import sys
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Literal, Optional
 
 import aiohttp
 from cryptography.fernet import Fernet, InvalidToken  # pip install cryptography
 from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, EmailStr, Field
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, EmailStr, Field, ValidationError
 
 from app.core import models
+from app.core.http import get_session
 
 # ────────────────────── Config ──────────────────────────────────
 AUTH_SERVER = os.getenv("HYATLAS_AUTH_URL", "http://localhost:9000").rstrip("/")
@@ -91,43 +93,58 @@ def _load_key() -> bytes:
     return key
 
 
-FERNET = Fernet(_load_key())
+@cache
+def _fernet() -> Fernet:
+    """Lazily built Fernet – keeps the key-file read off the import path."""
+    return Fernet(_load_key())
 
 
 def _save_token(token_obj: LoginResponse) -> None:
     try:
-        blob = FERNET.encrypt(json.dumps(token_obj.model_dump()).encode())
+        # model_dump_json serializes straight from pydantic-core (Rust),
+        # skipping the intermediate dict a model_dump() roundtrip builds
+        blob = _fernet().encrypt(token_obj.model_dump_json().encode())
         TOKEN_FILE.write_bytes(blob)
     except Exception as exc:
         raise HTTPException(500, f"Token konnte nicht gespeichert werden: {exc}") from exc
+    _load_token_cached.cache_clear()
 
 
 def _delete_token() -> None:
     TOKEN_FILE.unlink(missing_ok=True)
+    _load_token_cached.cache_clear()
 
 
-def _load_token() -> LoginResponse | None:
-    if not TOKEN_FILE.exists():
-        return None
+@lru_cache(maxsize=1)
+def _load_token_cached(mtime: float) -> LoginResponse | None:
+    # `mtime` only serves as cache key: same file mtime → same token.
     try:
         blob = TOKEN_FILE.read_bytes()
-        data = json.loads(FERNET.decrypt(blob, ttl=None))
-        return LoginResponse(**data)
-    except (InvalidToken, json.JSONDecodeError, TypeError):
+        return LoginResponse.model_validate_json(_fernet().decrypt(blob, ttl=None))
+    except (InvalidToken, ValidationError, OSError):
         # Datei korrupt → löschen
         TOKEN_FILE.unlink(missing_ok=True)
         return None
 
 
+def _load_token() -> LoginResponse | None:
+    if not TOKEN_FILE.exists():
+        return None
+    return _load_token_cached(TOKEN_FILE.stat().st_mtime)
+
+
 # ────────────────────── HTTP-Helper ─────────────────────────────
+_AUTH_TIMEOUT = aiohttp.ClientTimeout(total=10)   # built once, not per call
+
+
 async def _post_json(url: str, payload: dict) -> dict:
     try:
-        async with aiohttp.ClientSession() as sess:
-            async with sess.post(url, json=payload, timeout=10) as resp:
-                if resp.status == 401:
-                    raise HTTPException(401, "Benutzer/Passwort falsch")
-                resp.raise_for_status()
-                return await resp.json(content_type=None)
+        sess = await get_session()
+        async with sess.post(url, json=payload, timeout=_AUTH_TIMEOUT) as resp:
+            if resp.status == 401:
+                raise HTTPException(401, "Benutzer/Passwort falsch")
+            resp.raise_for_status()
+            return await resp.json(content_type=None)
     except aiohttp.ClientError as exc:
         raise HTTPException(502, f"Auth-Service offline: {exc}") from exc
 
@@ -150,7 +167,10 @@ async def login_status():
     Prüft, ob ein gültiger Token lokal gespeichert ist
     und gibt ihn (inklusiv User-Payload) zurück.
     """
-    return _load_token()
+    token = _load_token()
+    # serialize directly – this is polled constantly by the UI and needs
+    # no response_model re-validation of our own trusted model
+    return ORJSONResponse(token.model_dump() if token else None)
 
 
 @router.post("/login", response_model=LoginResponse)
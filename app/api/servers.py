@@ -2,55 +2,76 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import os
 import random
+import time
 import uuid
 from typing import List, Optional
 
 import aiohttp
-from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, Field, validator
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.core import models
+from app.core.http import get_session
 
 # ─────────────────────────────── DEV-Mock-Liste ────────────────────────────────
+_MOCK_RNG = random.Random(42)   # fixed seed → identical mock data every start
+
+
 def _make_mock(index: int) -> dict:
     return {
-        "id":          str(uuid.uuid4()),
+        "id":          str(uuid.UUID(int=index)),
         "name":        f"MockWorld #{index}",
         "description": "A lively voxel realm full of adventure and quests.",
         "address":     "127.0.0.1",
         "port":        25565 + index,
         "build_id":    "2025-07-dev",
-        "online_players": random.randint(0, 38),
+        "online_players": _MOCK_RNG.randint(0, 38),
         "max_players": 40,
-        "ping":        random.randint(20, 120),
+        "ping":        _MOCK_RNG.randint(20, 120),
         "thumbnail":   "/static/img/tile_placeholder.png",
     }
 
-MOCK_SERVERS: List[dict] = [_make_mock(i) for i in range(1, 31)]
+# Trusted internal data → model_construct skips the (slow) validation walk
+MOCK_SERVERS: List[models.ServerInfo] = [
+    models.ServerInfo.model_construct(**_make_mock(i)) for i in range(1, 31)
+]
 MM_DISABLED: bool = os.getenv("HYATLAS_MM_DISABLED", "1") != "0"
 
+# Mock data never changes within a process → serialize exactly once
+_MOCK_PAYLOAD: bytes = orjson.dumps([m.model_dump() for m in MOCK_SERVERS])
+_MOCK_ETAG: str = f'"{hashlib.sha256(_MOCK_PAYLOAD).hexdigest()[:16]}"'
+
 # ────────────────────────────────────────────────────────────────────────────────
 router = APIRouter(tags=["servers"])
 MM_URL  = os.getenv("HYATLAS_MM_URL", "https://mm.hyatlas.io").rstrip("/")
 
 # ─────────────────────────────── GET /api/servers ──────────────────────────────
 @router.get("/servers", response_model=List[models.ServerInfo])
-async def list_servers(channel: Optional[str] = None):
+async def list_servers(request: Request, channel: Optional[str] = None):
     """DEV → Mock‐Daten | PROD → externes Matchmaking‐Backend"""
     if MM_DISABLED:
-        # jede Dict in ein ServerInfo-Objekt casten → Validation OK
-        return [models.ServerInfo(**srv) for srv in MOCK_SERVERS]
+        # polling UIs send If-None-Match → collapse to a bodyless 304
+        if request.headers.get("if-none-match") == _MOCK_ETAG:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+        return Response(
+            _MOCK_PAYLOAD,
+            media_type="application/json",
+            headers={"ETag": _MOCK_ETAG},
+        )
 
     url    = f"{MM_URL}/v1/servers"
     params = {"channel": channel} if channel else None
 
     try:
-        async with aiohttp.ClientSession() as sess:
-            async with sess.get(url, params=params) as resp:
-                resp.raise_for_status()
-                data = await resp.json()
+        sess = await get_session()
+        async with sess.get(url, params=params) as resp:
+            resp.raise_for_status()
+            data = await resp.json()
     except aiohttp.ClientError as exc:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
@@ -58,7 +79,10 @@ async def list_servers(channel: Optional[str] = None):
         ) from exc
 
     try:
-        return [models.ServerInfo(**item) for item in data]
+        # validate once, then serialize directly – skips the response_model
+        # re-validation + jsonable_encoder pass FastAPI would otherwise run
+        infos = [models.ServerInfo(**item) for item in data]
+        return ORJSONResponse([m.model_dump() for m in infos])
     except Exception as exc:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
@@ -67,45 +91,50 @@ async def list_servers(channel: Optional[str] = None):
 
 # ─────────────────────────────── POST /api/servers/ping ─────────────────────────
 class PingRequest(BaseModel):
+    # str_strip_whitespace replaces the old @validator("address") strip
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     address: str = Field(description="Hostname or IPv4/IPv6")
     port:    int = Field(gt=0, lt=65536)
 
-    @validator("address")
-    def _strip(cls, v: str) -> str:        # pylint: disable=no-self-argument
-        return v.strip()
-
 class PingResponse(BaseModel):
     latencyMs: Optional[int] = None
     online:    bool
     buildId:   Optional[str] = None
 
-async def _tcp_ping(host: str, port: int) -> Optional[int]:
-    loop, start = asyncio.get_running_loop(), asyncio.get_running_loop().time()
+async def _tcp_ping(
+    host: str, port: int
+) -> tuple[Optional[int], Optional[asyncio.StreamReader], Optional[asyncio.StreamWriter]]:
+    """Open one connection; return (latency_ms, reader, writer) or Nones."""
+    start = time.perf_counter()
     try:
         reader, writer = await asyncio.wait_for(
             asyncio.open_connection(host, port), timeout=1.0
         )
-        writer.close(); await writer.wait_closed()
-        return int((loop.time() - start) * 1000)
+        return int((time.perf_counter() - start) * 1000), reader, writer
     except Exception:
-        return None
+        return None, None, None
 
 @router.post("/servers/ping", response_model=PingResponse)
 async def ping_server(payload: PingRequest):
-    latency = await _tcp_ping(payload.address, payload.port)
+    # one handshake for both latency measurement and banner read
+    latency, reader, writer = await _tcp_ping(payload.address, payload.port)
     if latency is None:
-        return PingResponse(latencyMs=None, online=False)
+        return ORJSONResponse(PingResponse(latencyMs=None, online=False).model_dump())
 
     build_id: Optional[str] = None
     try:
-        reader, writer = await asyncio.wait_for(
-            asyncio.open_connection(payload.address, payload.port), timeout=0.5
-        )
         banner = await asyncio.wait_for(reader.readexactly(16), timeout=0.5)
         if banner.startswith(b"HYATLAS\x00"):
             build_id = banner.split(b"\x00", 1)[1].decode(errors="ignore").strip()
-        writer.close(); await writer.wait_closed()
     except Exception:
         pass
-
-    return PingResponse(latencyMs=latency, online=True, buildId=build_id)
+    finally:
+        try:
+            writer.close(); await writer.wait_closed()
+        except Exception:
+            pass
+
+    return ORJSONResponse(
+        PingResponse(latencyMs=latency, online=True, buildId=build_id).model_dump()
+    )
@@ -21,7 +21,8 @@ from __future__ import annotations
 
 from typing import Dict, Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from app.core import config
@@ -55,7 +56,7 @@ class SettingsUpdate(BaseModel):
 # ──────────────────────────────────────────────
 def _merge(existing: Dict, update: SettingsUpdate) -> Dict:
     data = existing.copy()
-    up = update.dict(exclude_unset=True)
+    up = update.model_dump(exclude_unset=True)
 
     for key, val in up.items():
         if isinstance(val, dict) and isinstance(data.get(key), dict):
@@ -69,11 +70,19 @@ def _merge(existing: Dict, update: SettingsUpdate) -> Dict:
 # Routes
 # ──────────────────────────────────────────────
 @router.get("/settings", response_model=Settings)
-async def get_settings():
+async def get_settings(request: Request):
     """
     Return the currently effective settings (defaults overwritten by user file).
     """
-    return Settings(**config.read_config())
+    # settings only change on save → use the file mtime as ETag so the
+    # frontend's polling loop mostly gets bodyless 304s
+    etag = f'"{config.config_mtime_ns()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    return ORJSONResponse(
+        Settings(**config.read_config()).model_dump(),
+        headers={"ETag": etag},
+    )
 
 
 @router.post("/settings", response_model=Settings)
@@ -24,9 +24,11 @@ The heavy lifting is delegated to `app.core.updater`, which exposes:
 from __future__ import annotations
 
 import asyncio
-from typing import Optional
+import time
+from typing import Dict, Optional, Tuple
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from app.core import config, updater
@@ -52,13 +54,24 @@ class UpdateApplyRequest(BaseModel):
 # ──────────────────────────────────────────────
 # Helper
 # ──────────────────────────────────────────────
+# Short-lived manifest cache so the typical "check → apply" click
+# sequence fetches the manifest once, not twice.
+_MANIFEST_TTL = 30.0  # seconds
+_manifest_cache: Dict[str, Tuple[float, Manifest]] = {}
+
+
 async def _fetch_manifest_or_404(channel: str) -> Manifest:
+    cached = _manifest_cache.get(channel)
+    if cached and time.monotonic() - cached[0] < _MANIFEST_TTL:
+        return cached[1]
+
     manifest = await updater.get_remote_manifest(channel)
     if manifest is None:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail="Update service unavailable",
         )
+    _manifest_cache[channel] = (time.monotonic(), manifest)
     return manifest
 
 
@@ -76,11 +89,13 @@ async def check_update(channel: str = Query(config.DEFAULT_CHANNEL)):
     update_available = manifest.build_id != local_build
     dl_size = sum(f.size for f in manifest.files) if update_available else None
 
-    return UpdateCheckResponse(
-        currentBuildId=local_build,
-        latestBuildId=manifest.build_id if update_available else None,
-        updateAvailable=update_available,
-        downloadSize=dl_size,
+    return ORJSONResponse(
+        UpdateCheckResponse(
+            currentBuildId=local_build,
+            latestBuildId=manifest.build_id if update_available else None,
+            updateAvailable=update_available,
+            downloadSize=dl_size,
+        ).model_dump()
     )
 
 
@@ -19,10 +19,11 @@ milliseconds.
 
 from __future__ import annotations
 
-import json
 import os
 import platform
-import shutil
+from functools import lru_cache
+
+import orjson
 from pathlib import Path
 from typing import Any, Dict
 
@@ -42,6 +43,9 @@ REGISTRY_FILE_NAME = "registry.json"     # mod/resource registry
 # ──────────────────────────────────────────────
 # 2. Directory resolution helpers
 # ──────────────────────────────────────────────
+_SYSTEM: str = platform.system()   # never changes at runtime → resolve once
+
+
 def _home_base() -> Path:
     """Return the root folder for all user data (`~/.hyatlas/` on Unix,
     `%LOCALAPPDATA%\\Hyatlas\\` on Windows). Can be overridden with
@@ -49,7 +53,7 @@ def _home_base() -> Path:
     if env := os.getenv("HYATLAS_HOME"):
         return Path(env).expanduser().resolve()
 
-    if platform.system() == "Windows":
+    if _SYSTEM == "Windows":
         root = Path(os.getenv("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
         return (root / "Hyatlas").resolve()
 
@@ -83,8 +87,15 @@ _ALL_DIRS = (
 # ──────────────────────────────────────────────
 def ensure_dirs() -> None:
     """Create any missing directories (no error if they exist)."""
+    # All managed dirs share BASE_DIR as direct parent: create it once,
+    # then plain mkdir per child – skips the parents=True ancestor walk
+    # (which re-stats every path component) for each of the seven dirs.
+    BASE_DIR.mkdir(parents=True, exist_ok=True)
     for d in _ALL_DIRS:
-        d.mkdir(parents=True, exist_ok=True)
+        try:
+            os.mkdir(d)
+        except FileExistsError:
+            pass
 
 
 ensure_dirs()  # create on first import
@@ -105,33 +116,65 @@ _DEFAULT_SETTINGS: Dict[str, Any] = {
 def _load_raw() -> Dict[str, Any]:
     if _CONFIG_PATH.exists():
         try:
-            with _CONFIG_PATH.open(encoding="utf-8") as fh:
-                return json.load(fh)
-        except (json.JSONDecodeError, OSError):
-            # Backup the corrupted file before resetting
+            return orjson.loads(_CONFIG_PATH.read_bytes())
+        except (orjson.JSONDecodeError, OSError):
+            # Move the corrupted file aside (single rename, no copy loop)
             backup = _CONFIG_PATH.with_suffix(".bak")
-            shutil.copy2(_CONFIG_PATH, backup)
+            try:
+                _CONFIG_PATH.rename(backup)
+            except OSError:
+                pass
     return {}
 
 
-def read_config() -> Dict[str, Any]:
-    """Return merged settings (defaults overridden by user values)."""
+@lru_cache(maxsize=1)
+def _read_config_cached(mtime: float) -> Dict[str, Any]:
+    # `mtime` is only the cache key: unchanged file → unchanged settings.
     cfg = _DEFAULT_SETTINGS.copy()
     cfg.update(_load_raw())
     return cfg
 
 
+def read_config() -> Dict[str, Any]:
+    """Return merged settings (defaults overridden by user values)."""
+    try:
+        mtime = _CONFIG_PATH.stat().st_mtime
+    except OSError:
+        mtime = 0.0
+    return _read_config_cached(mtime)
+
+
 def save_config(new_cfg: Dict[str, Any]) -> None:
-    """Persist updated user settings atomically."""
+    """Persist updated user settings atomically (no-op if unchanged)."""
+    new_bytes = orjson.dumps(new_cfg, option=orjson.OPT_INDENT_2)
+    try:
+        if _CONFIG_PATH.read_bytes() == new_bytes:
+            return  # nothing changed → skip the write entirely
+    except OSError:
+        pass
+
     tmp = _CONFIG_PATH.with_suffix(".tmp")
-    with tmp.open("w", encoding="utf-8") as fh:
-        json.dump(new_cfg, fh, indent=2)
+    with tmp.open("wb") as fh:
+        fh.write(new_bytes)
+        fh.flush()
+        os.fsync(fh.fileno())
     tmp.replace(_CONFIG_PATH)
+    _read_config_cached.cache_clear()
 
 
 # ──────────────────────────────────────────────
 # 5. Helper utilities (public API)
 # ──────────────────────────────────────────────
+def config_mtime_ns() -> int:
+    """Nanosecond mtime of the settings file (0 if missing).
+
+    Cheap change marker – used by the settings API as ETag source."""
+    try:
+        return _CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
 def build_path(build_id: str) -> Path:
     """Return the directory for a specific client build."""
     return BUILDS_DIR / build_id
@@ -164,4 +207,5 @@ def _reset_for_tests(tmp_path: Path) -> None:  # pragma: no cover
     LOG_DIR = BASE_DIR / "logs"
     CONFIG_DIR = BASE_DIR / "config"
     _CONFIG_PATH = CONFIG_DIR / CONFIG_FILE_NAME
+    _read_config_cached.cache_clear()
     ensure_dirs()
@@ -0,0 +1,79 @@
+# app/core/hashing.py
+"""
+Hyatlas Launcher – digest helpers
+=================================
+
+Central place for the content-hash plumbing shared by the updater and
+the mod cache.  Servers historically publish SHA-256 digests; newer
+manifests may additionally advertise a BLAKE2b-256 digest, which is
+noticeably faster to compute on CPUs without SHA extensions while
+giving the same 256-bit collision guarantees.  When both are present
+we prefer BLAKE2b and keep SHA-256 as the legacy fallback.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import sys
+from pathlib import Path
+
+#: default algorithm when the server does not advertise anything newer
+DEFAULT_ALGO = "sha256"
+
+#: above this size the read()-per-chunk syscall overhead starts to
+#: matter and we hand the kernel-paged file to OpenSSL in one go
+_MMAP_THRESHOLD = 8 * 1024 * 1024
+
+
+def new_hasher(algo: str = DEFAULT_ALGO) -> "hashlib._Hash":
+    """Return a fresh hash object for the given algorithm name."""
+    if algo == "blake2b":
+        return hashlib.blake2b(digest_size=32)
+    return hashlib.sha256()
+
+
+def expected_digest(obj) -> tuple[str, str]:
+    """Return (algo, hexdigest) for a manifest/descriptor-like object.
+
+    Prefers the ``blake2b`` field when the server sent one, otherwise
+    falls back to the mandatory ``sha256`` field.  Both digests are
+    256 bit, so the hex digest is always 64 chars for consumers.
+    """
+    blake = getattr(obj, "blake2b", None)
+    if blake:
+        return "blake2b", blake
+    return DEFAULT_ALGO, obj.sha256
+
+
+def hash_file(file_path: Path, algo: str = DEFAULT_ALGO) -> str:
+    """Return the hex digest of a file on disk.
+
+    Large files are memory-mapped and digested as one contiguous
+    buffer: the kernel pages data in on demand and OpenSSL drives its
+    hardware-accelerated core over the whole file without per-chunk
+    round-trips.  Smaller files (or platforms where mmap fails) use
+    ``hashlib.file_digest`` on Python 3.11+, which runs the read/update
+    loop in C, or a chunked Python loop on older interpreters.
+    """
+    if file_path.stat().st_size > _MMAP_THRESHOLD:
+        try:
+            with file_path.open("rb") as fh, mmap.mmap(
+                fh.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mm:
+                h = new_hasher(algo)
+                with memoryview(mm) as view:
+                    h.update(view)
+                return h.hexdigest()
+        except (ValueError, OSError):
+            pass  # fall through to the chunked paths
+
+    if sys.version_info >= (3, 11):
+        with file_path.open("rb", buffering=0) as fh:
+            return hashlib.file_digest(fh, lambda: new_hasher(algo)).hexdigest()
+
+    h = new_hasher(algo)
+    with file_path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(65536), b""):
+            h.update(chunk)
+    return h.hexdigest()
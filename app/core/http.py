@@ -0,0 +1,43 @@
+# app/core/http.py
+"""
+Hyatlas Launcher – shared aiohttp session
+=========================================
+
+All outbound HTTP calls (auth service, matchmaking, update server)
+should go through the single `ClientSession` managed here instead of
+creating a throw-away session per request.  A fresh session means a
+fresh connector, DNS lookup and TLS handshake for every small JSON
+POST – reusing one session lets keep-alive amortise all of that.
+
+Lifecycle: `app/main.py` wires `close_session()` into the FastAPI
+shutdown event; the session itself is created lazily on first use so
+importing this module stays free of side effects.
+"""
+
+from __future__ import annotations
+
+import aiohttp
+
+SESSION: aiohttp.ClientSession | None = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the process-wide ClientSession, creating it on first use."""
+    global SESSION
+    if SESSION is None or SESSION.closed:
+        SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+            )
+        )
+    return SESSION
+
+
+async def close_session() -> None:
+    """Close the shared session (called from the app shutdown hook)."""
+    global SESSION
+    if SESSION is not None and not SESSION.closed:
+        await SESSION.close()
+    SESSION = None
@@ -24,6 +24,7 @@ import platform
 import shutil
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Sequence
 
@@ -34,28 +35,36 @@ from app.core.models import ServerInfo
 # ──────────────────────────────────────────────
 # 1. Locate executable
 # ──────────────────────────────────────────────
+_SYSTEM = platform.system()
+
+
+@lru_cache(maxsize=8)
 def locate_executable(build_id: str) -> Path:
     """
     Return platform-specific client executable.
 
+    Cached per build_id (a build's binary never moves once installed);
+    the updater clears the cache after installing a new build.
     Raises FileNotFoundError if the binary is missing.
     """
     build_dir = config.build_path(build_id)
     if not build_dir.exists():
         raise FileNotFoundError(f"Build '{build_id}' not installed")
 
-    system = platform.system()
-    exe_name = "Hyatlas.exe" if system == "Windows" else "Hyatlas.x86_64"
+    exe_name = "Hyatlas.exe" if _SYSTEM == "Windows" else "Hyatlas.x86_64"
     exe_path = build_dir / exe_name
 
     if not exe_path.exists():
-        # Fallback: first file with executable flag
-        for cand in build_dir.iterdir():
-            if cand.is_file() and os.access(cand, os.X_OK):
-                exe_path = cand
-                break
-        else:
-            raise FileNotFoundError(f"No executable found in {build_dir}")
+        # Fallback: first file with executable flag.  scandir hands back
+        # DirEntry objects with cached stat info → one syscall per dir,
+        # not one per candidate.
+        with os.scandir(build_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and os.access(entry.path, os.X_OK):
+                    exe_path = Path(entry.path)
+                    break
+            else:
+                raise FileNotFoundError(f"No executable found in {build_dir}")
 
     return exe_path.resolve()
 
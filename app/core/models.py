@@ -14,12 +14,14 @@ logic – that belongs in `core/` sub-modules.
 
 from __future__ import annotations
 
+import dataclasses
 import enum
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field, HttpUrl, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 # ──────────────────────────────────────────────
@@ -47,6 +49,7 @@ class ModRequirement(BaseModel):
     id: str
     version: str
     sha256: str
+    blake2b: Optional[str] = None      # optional faster digest (256 bit)
     paid: bool = False
 
 
@@ -61,7 +64,8 @@ class ServerInfo(BaseModel):
     requires_official_client: bool = True
     mods: List[ModRequirement] = Field(default_factory=list)
 
-    @validator("port")
+    @field_validator("port")
+    @classmethod
     def port_range(cls, v: int) -> int:
         if not (1 <= v <= 65535):
             raise ValueError("port must be between 1 and 65535")
@@ -74,22 +78,32 @@ class ServerInfo(BaseModel):
 class ManifestFile(BaseModel):
     path: str
     sha256: str
+    blake2b: Optional[str] = None      # optional faster digest (256 bit)
     size: int
-    url: Optional[HttpUrl] = None      # may be repo-relative
+    # plain str: full URL validation per row is the dominant cost when
+    # ingesting 1000+ file manifests; download sites do a cheap check
+    url: Optional[str] = None          # may be repo-relative
 
     class Config:
         frozen = True                  # hashable
 
 
 class Manifest(BaseModel):
+    # keep pydantic's schema walk away from the lazily built lookup cache
+    model_config = ConfigDict(ignored_types=(cached_property,))
+
     build_id: str
     unity_version: str
     channel: str                       # stable / nightly / …
     files: List[ManifestFile]
     signature: str                     # RSA-PSS base64
 
+    @cached_property
+    def _by_path(self) -> Dict[str, ManifestFile]:
+        return {f.path: f for f in self.files}
+
     def file_by_path(self, rel_path: str) -> Optional[ManifestFile]:
-        return next((f for f in self.files if f.path == rel_path), None)
+        return self._by_path.get(rel_path)
 
 
 # ──────────────────────────────────────────────
@@ -104,9 +118,10 @@ class ModDescriptor(BaseModel):
     id: str
     version: str
     sha256: str
+    blake2b: Optional[str] = None      # optional faster digest (256 bit)
     type: PackageType = PackageType.mod
     paid: bool = False
-    url: Optional[HttpUrl] = None
+    url: Optional[str] = None          # checked at download time, see cache
     signature: Optional[str] = None    # RSA signature (optional for free mods)
 
 
@@ -117,8 +132,15 @@ class RegistryStatus(str, enum.Enum):
     unknown = "unknown"
 
 
-class RegistryEntry(BaseModel):
-    """Entry stored in ~/.hyatlas/mods/registry.json"""
+@dataclasses.dataclass(slots=True, frozen=True)
+class RegistryEntry:
+    """Entry stored in ~/.hyatlas/mods/registry.json
+
+    Deliberately a plain dataclass: the registry is written by the
+    launcher itself and read back on every start, so there is no
+    untrusted input to validate – pydantic's schema walk here would be
+    pure overhead for hundreds of mods.
+    """
     id: str
     version: str
     sha256: str
@@ -132,6 +154,34 @@ class RegistryEntry(BaseModel):
     def is_usable(self) -> bool:
         return self.status == RegistryStatus.verified
 
+    @classmethod
+    def from_dict(cls, val: dict) -> "RegistryEntry":
+        """Cheap coercion for our own registry JSON (no schema walk)."""
+        scanned = val.get("scanned_at")
+        return cls(
+            id=val["id"],
+            version=val["version"],
+            sha256=val["sha256"],
+            type=PackageType(val["type"]),
+            path=Path(val["path"]),
+            status=RegistryStatus(val.get("status", "unknown")),
+            scanned_at=datetime.fromisoformat(scanned) if scanned else None,
+            malware=val.get("malware"),
+        )
+
+    def to_dict(self) -> dict:
+        """JSON-safe counterpart of from_dict."""
+        return {
+            "id": self.id,
+            "version": self.version,
+            "sha256": self.sha256,
+            "type": self.type.value,
+            "path": str(self.path),
+            "status": self.status.value,
+            "scanned_at": self.scanned_at.isoformat() if self.scanned_at else None,
+            "malware": self.malware,
+        }
+
 
 # ──────────────────────────────────────────────
 # 5. Pydantic global config
@@ -20,17 +20,19 @@ their paths to the game executable via launch arguments.
 
 from __future__ import annotations
 
-import hashlib
-import json
+import os
 import shutil
 import subprocess
 import sys
+import zipfile
 from pathlib import Path
 from typing import Dict, List, Sequence
 
 import aiohttp
+import orjson
 
-from app.core import config
+from app.core import config, hashing
+from app.core.http import get_session
 from app.core.models import (
     ModDescriptor,
     ModRequirement,
@@ -54,22 +56,30 @@ def _load_registry() -> Dict[str, RegistryEntry]:
         return {}
 
     try:
-        with REGISTRY_PATH.open(encoding="utf-8") as fh:
-            raw = json.load(fh)
-            return {
-                key: RegistryEntry(**val)  # type: ignore[arg-type]
-                for key, val in raw.items()
-            }
-    except (json.JSONDecodeError, OSError):
+        raw = orjson.loads(REGISTRY_PATH.read_bytes())
+        return {
+            key: RegistryEntry.from_dict(val)
+            for key, val in raw.items()
+        }
+    except (orjson.JSONDecodeError, OSError):
         backup = REGISTRY_PATH.with_suffix(".corrupt.json")
         shutil.copy2(REGISTRY_PATH, backup)
         return {}
 
 
 def _save_registry(entries: Dict[str, RegistryEntry]) -> None:
+    payload = orjson.dumps(
+        {k: v.to_dict() for k, v in entries.items()},
+        option=orjson.OPT_INDENT_2,
+    )
+    try:
+        if REGISTRY_PATH.read_bytes() == payload:
+            return  # idempotent: identical content → skip the write
+    except OSError:
+        pass
+
     tmp = REGISTRY_PATH.with_suffix(".tmp")
-    with tmp.open("w", encoding="utf-8") as fh:
-        json.dump({k: v.dict() for k, v in entries.items()}, fh, indent=2)
+    tmp.write_bytes(payload)
     tmp.replace(REGISTRY_PATH)
 
 
@@ -77,6 +87,22 @@ def _key(mod_id: str, version: str) -> str:
     return f"{mod_id}:{version}"
 
 
+def _fast_move(src: Path, dst: Path) -> None:
+    """Move `src` to `dst`, preferring the cheapest mechanism available.
+
+    os.rename is a single syscall on the same filesystem; across
+    filesystems (cache on tmpfs, mods on the home disk is a common
+    layout) shutil.copyfile uses the kernel zero-copy fast paths
+    (sendfile / copy_file_range / CopyFileW) that shutil.move's generic
+    16 KiB fallback loop does not.
+    """
+    try:
+        os.rename(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst, follow_symlinks=False)
+        src.unlink()
+
+
 # ──────────────────────────────────────────────
 # Public API
 # ──────────────────────────────────────────────
@@ -97,7 +123,7 @@ async def sync_with_server(
         entry = registry.get(key)
 
         if entry and entry.status == RegistryStatus.verified:
-            if entry.sha256 == req.sha256 and entry.path.exists():
+            if entry.sha256 == hashing.expected_digest(req)[1] and entry.path.exists():
                 verified_paths.append(entry.path)
                 continue  # already good
 
@@ -107,6 +133,7 @@ async def sync_with_server(
                 id=req.id,
                 version=req.version,
                 sha256=req.sha256,
+                blake2b=req.blake2b,
                 type=PackageType.mod,
                 paid=req.paid,
                 url=None,           # server will provide absolute URL in handshake
@@ -114,17 +141,21 @@ async def sync_with_server(
         )
 
     # 2) Download & verify missing packages
+    dirty = False
     if to_fetch:
-        async with aiohttp.ClientSession() as session:
-            for descriptor in to_fetch:
-                archive = await _download_package(session, descriptor)
-                entry = await _install_package(archive, descriptor)
-                registry[_key(entry.id, entry.version)] = entry
-                if entry.status == RegistryStatus.verified:
-                    verified_paths.append(entry.path)
-
-    # 3) Persist registry
-    _save_registry(registry)
+        session = await get_session()   # shared keep-alive session
+        for descriptor in to_fetch:
+            archive, sha256 = await _download_package(session, descriptor)
+            entry = await _install_package(archive, sha256, descriptor)
+            registry[_key(entry.id, entry.version)] = entry
+            dirty = True
+            if entry.status == RegistryStatus.verified:
+                verified_paths.append(entry.path)
+
+    # 3) Persist registry – only when something actually changed, so the
+    #    common "all mods already verified" launch does zero disk writes
+    if dirty:
+        _save_registry(registry)
     return verified_paths
 
 
@@ -134,48 +165,87 @@ async def sync_with_server(
 async def _download_package(
     session: aiohttp.ClientSession,
     descriptor: ModDescriptor,
-) -> Path:
-    """Save ZIP to cache/ and return the path."""
+) -> tuple[Path, str]:
+    """Stream ZIP to cache/ (hashing on the fly); return (path, sha256).
+
+    Hashing each chunk as it arrives avoids re-reading the whole file
+    from disk afterwards – same pattern as updater._download_file.
+    """
     if descriptor.url is None:
         raise RuntimeError(f"No download URL for mod '{descriptor.id}'")
+    if not descriptor.url.startswith(("http://", "https://")):
+        raise RuntimeError(f"Invalid download URL for mod '{descriptor.id}'")
 
     filename = f"{descriptor.id}-{descriptor.version}.zip"
     dest = config.CACHE_DIR / filename
+    tmp = dest.with_suffix(".tmp")
+    algo, _ = hashing.expected_digest(descriptor)
+    hasher = hashing.new_hasher(algo)
 
     async with session.get(descriptor.url) as resp:
         resp.raise_for_status()
-        with dest.open("wb") as fh:
-            async for chunk in resp.content.iter_chunked(8192):
-                fh.write(chunk)
-    return dest
-
-
-async def _install_package(archive: Path, descriptor: ModDescriptor) -> RegistryEntry:
+        # raw fd writes skip the buffered-IO copy (same as the updater)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if resp.content_length:
+                try:
+                    os.posix_fallocate(fd, 0, resp.content_length)
+                except (AttributeError, OSError):
+                    pass  # not supported on this platform/filesystem
+            async for chunk in resp.content.iter_chunked(1 << 20):
+                os.write(fd, chunk)
+                hasher.update(chunk)
+        finally:
+            os.close(fd)
+
+    tmp.replace(dest)
+    return dest, hasher.hexdigest()
+
+
+async def _install_package(
+    archive: Path, sha256: str, descriptor: ModDescriptor
+) -> RegistryEntry:
     """
     Verify SHA256, RSA signature & AV scan, then move/extract to mods/.
     Returns the resulting registry entry.
     """
-    sha256 = _calc_sha256(archive)
     key = _key(descriptor.id, descriptor.version)
 
-    if sha256 != descriptor.sha256:
+    algo, expected = hashing.expected_digest(descriptor)
+    if sha256 != expected:
         return _quarantine(
-            key, archive, sha256, reason="sha256 mismatch (tampered?)"
+            key, archive, sha256, reason=f"{algo} mismatch (tampered?)"
         )
 
-    # RSA + AV scan
-    if not verifier.verify_package(archive, descriptor):
+    # RSA + AV scan (reuse the digest when it is the SHA-256 one)
+    if not await verifier.verify_package(
+        archive, descriptor, sha256=sha256 if algo == "sha256" else None
+    ):
         return _quarantine(key, archive, sha256, reason="signature or AV failed")
 
-    # Extraction/move
+    # Extraction
     target_dir = config.mod_path(descriptor.id, descriptor.version)
     if target_dir.exists():
         shutil.rmtree(target_dir)
     target_dir.mkdir(parents=True, exist_ok=True)
 
-    # We simply move the archive for now; later we can extract if desired
-    dest_archive = target_dir / archive.name
-    shutil.move(archive, dest_archive)
+    # Extract now (sequential writes, warm page cache) so the game never
+    # has to random-read ZIP central directories at launch time
+    try:
+        with zipfile.ZipFile(archive) as zf:
+            zf.extractall(target_dir)
+    except (zipfile.BadZipFile, OSError):
+        shutil.rmtree(target_dir, ignore_errors=True)
+        return _quarantine(key, archive, sha256, reason="corrupt archive")
+
+    # keep the sealed archive for later integrity re-checks,
+    # content-addressed by its digest
+    obj = config.CACHE_DIR / ".objects" / sha256[:2] / sha256
+    obj.parent.mkdir(parents=True, exist_ok=True)
+    if obj.exists():
+        archive.unlink(missing_ok=True)
+    else:
+        _fast_move(archive, obj)
 
     return RegistryEntry(
         id=descriptor.id,
@@ -191,7 +261,7 @@ async def _install_package(archive: Path, descriptor: ModDescriptor) -> Registry
 def _quarantine(key: str, archive: Path, sha256: str, reason: str) -> RegistryEntry:
     """Move a suspicious package to ~/.hyatlas/quarantine/ and record it."""
     q_path = config.QUARANTINE_DIR / archive.name
-    shutil.move(archive, q_path)
+    _fast_move(archive, q_path)
 
     sys.stderr.write(f"[cache] Package {archive.name} quarantined: {reason}\n")
 
@@ -207,8 +277,4 @@ def _quarantine(key: str, archive: Path, sha256: str, reason: str) -> RegistryEn
 
 
 def _calc_sha256(file_path: Path) -> str:
-    h = hashlib.sha256()
-    with file_path.open("rb") as fh:
-        for chunk in iter(lambda: fh.read(65536), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    return hashing.hash_file(file_path, "sha256")
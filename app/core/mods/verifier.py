@@ -23,18 +23,21 @@ new server keys there (after user confirmation) and removes revoked ones.
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from cryptography.hazmat.primitives.asymmetric import padding, rsa, utils
 
-from app.core import config
+from app.core import config, hashing
 from app.core.models import ModDescriptor
 
 _KEYS_DIR: Path = config.CONFIG_DIR / "keys"
@@ -45,32 +48,65 @@ _last_scan: datetime | None = None
 # ──────────────────────────────────────────────
 # 1. Key loading helpers
 # ──────────────────────────────────────────────
-def _load_public_keys() -> List[rsa.RSAPublicKey]:
-    """Return all RSA public keys found in ~/.hyatlas/config/keys/"""
-    keys: List[rsa.RSAPublicKey] = []
-    for pem in _KEYS_DIR.glob("*.pem"):
-        try:
-            with pem.open("rb") as fh:
-                pub = serialization.load_pem_public_key(fh.read())
-                if isinstance(pub, rsa.RSAPublicKey):
-                    keys.append(pub)
-        except Exception:
-            sys.stderr.write(f"[verifier] Ignoring invalid key file {pem.name}\n")
-    return keys
+# (mtime_ns, parsed key) per PEM file.  Refreshed on each verification
+# through a single scandir pass, so only changed files are re-parsed and
+# newly trusted / revoked keys take effect without a launcher restart.
+_KEY_CACHE: Dict[str, Tuple[int, Optional[rsa.RSAPublicKey]]] = {}
 
 
-_PUBLIC_KEYS = _load_public_keys()
+def _public_keys() -> List[rsa.RSAPublicKey]:
+    """Return all RSA public keys found in ~/.hyatlas/config/keys/"""
+    seen: set[str] = set()
+    with os.scandir(_KEYS_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".pem") or not entry.is_file():
+                continue
+            seen.add(entry.path)
+            mtime = entry.stat().st_mtime_ns
+            cached = _KEY_CACHE.get(entry.path)
+            if cached and cached[0] == mtime:
+                continue  # unchanged → keep the parsed key
+            try:
+                pub = serialization.load_pem_public_key(Path(entry.path).read_bytes())
+                key = pub if isinstance(pub, rsa.RSAPublicKey) else None
+            except Exception:
+                sys.stderr.write(f"[verifier] Ignoring invalid key file {entry.name}\n")
+                key = None
+            _KEY_CACHE[entry.path] = (mtime, key)
+
+    # forget keys whose PEM files were removed (revoked)
+    for stale in set(_KEY_CACHE) - seen:
+        del _KEY_CACHE[stale]
+
+    return [key for _, key in _KEY_CACHE.values() if key is not None]
+
+# Successful keys float to the front of the try order, so the typical
+# archive verifies on the first attempt instead of paying (n-1) failed
+# RSA-PSS operations when e.g. the Marketplace key globs in last.
+_KEY_HITS: Dict[bytes, int] = {}
+
+
+def _fingerprint(key: rsa.RSAPublicKey) -> bytes:
+    return key.public_bytes(
+        serialization.Encoding.DER,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
 
 
 # ──────────────────────────────────────────────
 # 2. Signature verification
 # ──────────────────────────────────────────────
-def _verify_signature(archive: Path, signature_b64: str | None) -> bool:
+def _verify_signature(
+    archive: Path,
+    signature_b64: str | None,
+    sha256_hex: str | None = None,
+) -> bool:
     if not signature_b64:
         # free mods may omit a signature
         return True
 
-    if not _PUBLIC_KEYS:
+    available = _public_keys()
+    if not available:
         sys.stderr.write("[verifier] No trusted public keys available\n")
         return False
 
@@ -79,33 +115,70 @@ def _verify_signature(archive: Path, signature_b64: str | None) -> bool:
     except Exception:
         return False
 
-    data = archive.read_bytes()
-    for key in _PUBLIC_KEYS:
-        try:
-            key.verify(
-                sig,
-                data,
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH,
-                ),
-                hashes.SHA256(),
-            )
-            return True  # verified with this key
-        except InvalidSignature:
-            continue
+    # RSA-PSS only needs the SHA-256 digest, not the whole message:
+    # hash the archive once (streaming, O(64 KiB) memory instead of the
+    # full file in RAM) and verify with Prehashed against every key.
+    if sha256_hex is None:
+        sha256_hex = hashing.hash_file(archive, "sha256")
+    digest = bytes.fromhex(sha256_hex)
+
+    # most-recently-successful keys first
+    keys = sorted(
+        available,
+        key=lambda k: _KEY_HITS.get(_fingerprint(k), 0),
+        reverse=True,
+    )
+
+    if len(keys) > 4:
+        # cryptography releases the GIL during RSA verify → worth
+        # fanning out across threads for larger trust stores
+        with ThreadPoolExecutor(max_workers=len(keys)) as pool:
+            futures = {pool.submit(_try_verify, k, sig, digest): k for k in keys}
+            for fut in as_completed(futures):
+                if fut.result():
+                    fp = _fingerprint(futures[fut])
+                    _KEY_HITS[fp] = _KEY_HITS.get(fp, 0) + 1
+                    for other in futures:
+                        other.cancel()
+                    return True
+        return False
+
+    for key in keys:
+        if _try_verify(key, sig, digest):
+            fp = _fingerprint(key)
+            _KEY_HITS[fp] = _KEY_HITS.get(fp, 0) + 1
+            return True
 
     return False  # none matched
 
 
+def _try_verify(key: rsa.RSAPublicKey, sig: bytes, digest: bytes) -> bool:
+    try:
+        key.verify(
+            sig,
+            digest,
+            padding.PSS(
+                mgf=padding.MGF1(hashes.SHA256()),
+                salt_length=padding.PSS.MAX_LENGTH,
+            ),
+            utils.Prehashed(hashes.SHA256()),
+        )
+        return True
+    except InvalidSignature:
+        return False
+
+
 # ──────────────────────────────────────────────
 # 3. Antivirus wrapper
 # ──────────────────────────────────────────────
-def _scan_with_av(archive: Path) -> bool:
+async def _scan_with_av(archive: Path) -> bool:
     """
     Calls scripts/av_scan.sh which abstracts over ClamAV / Windows Defender.
     The script must exit 0 on success, non-zero if malware was found or an
     error occurred.
+
+    Runs as an asyncio subprocess so a minutes-long scan no longer
+    blocks the event loop (and with it all in-flight downloads).
     """
     global _last_scan
     script_path = Path(__file__).resolve().parents[2] / "scripts" / "av_scan.sh"
@@ -113,37 +186,59 @@ def _scan_with_av(archive: Path) -> bool:
         sys.stderr.write("[verifier] AV script missing – skipping scan!\n")
         return True  # fallback (should never happen in production)
 
-    res = subprocess.run([str(script_path), str(archive)], capture_output=True)
+    proc = await asyncio.create_subprocess_exec(
+        str(script_path),
+        str(archive),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    stdout, _ = await proc.communicate()
     _last_scan = datetime.now(tz=timezone.utc)
 
-    if res.returncode == 0:
+    if proc.returncode == 0:
         return True
 
-    sys.stderr.write(f"[verifier] AV scan flagged {archive.name}:\n{res.stdout.decode()}\n")
+    sys.stderr.write(f"[verifier] AV scan flagged {archive.name}:\n{stdout.decode()}\n")
     return False
 
 
 # ──────────────────────────────────────────────
 # 4. Public API
 # ──────────────────────────────────────────────
-def verify_package(archive: Path, descriptor: ModDescriptor) -> bool:
+async def verify_package(
+    archive: Path,
+    descriptor: ModDescriptor,
+    sha256: str | None = None,
+) -> bool:
     """
     Returns True if both cryptographic signature AND AV scan succeed.
+
+    Pass `sha256` when the caller already computed the archive digest
+    (e.g. while downloading) so it is not hashed a second time.
     """
     if not archive.exists():
         sys.stderr.write("[verifier] archive path does not exist\n")
         return False
 
-    if not _verify_signature(archive, descriptor.signature):
+    if not _verify_signature(archive, descriptor.signature, sha256):
         sys.stderr.write(f"[verifier] signature check failed for {archive.name}\n")
         return False
 
-    if not _scan_with_av(archive):
+    if not await _scan_with_av(archive):
         return False
 
     return True
 
 
+def verify_package_sync(
+    archive: Path,
+    descriptor: ModDescriptor,
+    sha256: str | None = None,
+) -> bool:
+    """Thin wrapper for callers that are not running an event loop."""
+    return asyncio.run(verify_package(archive, descriptor, sha256))
+
+
 def last_scan_time() -> datetime | None:
     """Return the timestamp of the most recent AV scan run in this session."""
     return _last_scan
@@ -25,8 +25,8 @@ Filesystem layout
 from __future__ import annotations
 
 import asyncio
-import hashlib
-import json
+import concurrent.futures
+import os
 import shutil
 import sys
 import tempfile
@@ -34,11 +34,14 @@ from pathlib import Path
 from typing import Dict, Optional
 
 import aiohttp
+import orjson
 
-from app.core import config, models
+from app.core import config, hashing, models
+from app.core.http import get_session
 
 _MANIFEST_URL = "https://updates.hyatlas.io/{channel}/manifest.json"
 _MARKER_NAME = "channel-current.txt"   # lives in builds/
+_OBJECTS_DIR_NAME = ".objects"         # content-addressed store in builds/
 
 # ──────────────────────────────────────────────
 # 1. Local build helpers
@@ -67,17 +70,17 @@ def _write_marker(channel: str, build_id: str) -> None:
 async def get_remote_manifest(channel: str) -> Optional[models.Manifest]:
     url = _MANIFEST_URL.format(channel=channel)
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                if resp.status != 200:
-                    return None
-                raw = await resp.json()
+        session = await get_session()   # shared keep-alive session
+        async with session.get(url) as resp:
+            if resp.status != 200:
+                return None
+            body = await resp.read()
     except aiohttp.ClientError as exc:
         sys.stderr.write(f"[updater] manifest download failed: {exc}\n")
         return None
 
     try:
-        return models.Manifest(**raw)
+        return models.Manifest(**orjson.loads(body))
     except Exception as exc:
         sys.stderr.write(f"[updater] malformed manifest: {exc}\n")
         return None
@@ -86,28 +89,78 @@ async def get_remote_manifest(channel: str) -> Optional[models.Manifest]:
 # ──────────────────────────────────────────────
 # 3. Apply update
 # ──────────────────────────────────────────────
+# Digesting multi-MB files is CPU work that would otherwise block the
+# event loop (and with it all concurrent downloads).  A process pool
+# spreads verification across cores; created lazily on first update.
+_HASH_POOL: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+
+def _hash_pool() -> concurrent.futures.ProcessPoolExecutor:
+    global _HASH_POOL
+    if _HASH_POOL is None:
+        _HASH_POOL = concurrent.futures.ProcessPoolExecutor(
+            max_workers=os.cpu_count()
+        )
+    return _HASH_POOL
+
+
+def _object_path(digest: str) -> Path:
+    """Location of a file in the content-addressed store, keyed by digest."""
+    return config.BUILDS_DIR / _OBJECTS_DIR_NAME / digest[:2] / digest
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink where the filesystem allows it, fall back to a copy."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
 async def _download_file(
     session: aiohttp.ClientSession,
     url: str,
     dest: Path,
-    expected_sha256: str,
+    file: models.ManifestFile,
+    net_sem: asyncio.Semaphore,
 ) -> None:
     """
-    Stream download to dest, verify sha256, raise RuntimeError if mismatch.
+    Stream download to dest, verify the manifest digest,
+    raise RuntimeError if mismatch.
+
+    `net_sem` throttles only the network transfer – hashing runs in the
+    process pool and needs no network-sized gate.
     """
-    hasher = hashlib.sha256()
-    tmp = dest.with_suffix(".tmp")
+    if file.url and not file.url.startswith(("http://", "https://")):
+        raise RuntimeError(f"Invalid download URL for {dest.name}")
 
-    async with session.get(url) as resp:
-        resp.raise_for_status()
-        with tmp.open("wb") as fh:
-            async for chunk in resp.content.iter_chunked(65536):
-                fh.write(chunk)
-                hasher.update(chunk)
+    algo, expected = hashing.expected_digest(file)
+    tmp = dest.with_suffix(".tmp")
 
-    if hasher.hexdigest() != expected_sha256:
+    async with net_sem:
+        async with session.get(url) as resp:
+            resp.raise_for_status()
+            # raw fd writes skip the buffered-IO copy; 1 MiB chunks keep
+            # the Python<->C crossings per GB low
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                if file.size:
+                    try:
+                        os.posix_fallocate(fd, 0, file.size)
+                    except (AttributeError, OSError):
+                        pass  # not supported on this platform/filesystem
+                async for chunk in resp.content.iter_chunked(1 << 20):
+                    os.write(fd, chunk)
+            finally:
+                os.close(fd)
+
+    # hash off-loop: keeps the event loop free to drive other downloads
+    loop = asyncio.get_running_loop()
+    digest = await loop.run_in_executor(_hash_pool(), hashing.hash_file, tmp, algo)
+
+    if digest != expected:
         tmp.unlink(missing_ok=True)
-        raise RuntimeError(f"SHA256 mismatch for {dest.name}")
+        raise RuntimeError(f"{algo} mismatch for {dest.name}")
 
     tmp.replace(dest)
 
@@ -123,29 +176,54 @@ async def apply_update(manifest: models.Manifest) -> None:
         shutil.rmtree(build_dir)
     build_dir.mkdir(parents=True, exist_ok=True)
 
-    async with aiohttp.ClientSession() as session:
-        # parallel downloads (max 4 at once)
-        semaphore = asyncio.Semaphore(4)
-        tasks = []
+    session = await get_session()   # shared keep-alive session
+
+    # 16 concurrent transfers saturate a gigabit link even for manifests
+    # made of many small files; hashing is not gated by this semaphore
+    net_sem = asyncio.Semaphore(16)
 
-        for f in manifest.files:
-            dest_path = build_dir / f.path
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
+    async def _fetch(file: models.ManifestFile) -> None:
+        dest = build_dir / file.path
+        dest.parent.mkdir(parents=True, exist_ok=True)
 
-            async def _task(file=f):
-                async with semaphore:
-                    await _download_file(session, file.url or f.path, dest_path, file.sha256)
+        # unchanged files are shared across builds → reuse the verified
+        # copy from the object store instead of re-downloading it
+        obj = _object_path(hashing.expected_digest(file)[1])
+        if obj.exists():
+            _link_or_copy(obj, dest)
+            return
 
-            tasks.append(asyncio.create_task(_task()))
+        await _download_file(session, file.url or file.path, dest, file, net_sem)
 
-        # wait and propagate first exception
-        await asyncio.gather(*tasks)
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            _link_or_copy(dest, obj)
+        except OSError:
+            pass  # store population is best-effort
+
+    # largest-first scheduling trims tail latency on mixed-size manifests
+    ordered = sorted(manifest.files, key=lambda f: f.size, reverse=True)
+    tasks = [asyncio.create_task(_fetch(f)) for f in ordered]
+
+    try:
+        for fut in asyncio.as_completed(tasks):
+            await fut
+    except BaseException:
+        # one file failed → stop the siblings instead of finishing a
+        # build we are about to throw away
+        for t in tasks:
+            t.cancel()
+        raise
 
     # Persist manifest locally (for delta diff checks later)
-    (build_dir / "manifest.json").write_text(
-        json.dumps(manifest.dict(), indent=2), encoding="utf-8"
+    (build_dir / "manifest.json").write_bytes(
+        orjson.dumps(manifest.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
     )
 
     # Update channel marker
     _write_marker(channel, manifest.build_id)
+
+    # New build on disk → drop the memoized executable lookup
+    from app.core import launcher  # local import avoids a cycle at module load
+    launcher.locate_executable.cache_clear()
     sys.stdout.write(f"[updater] updated to {manifest.build_id} ({channel})\n")
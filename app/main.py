@@ -16,13 +16,14 @@ import threading
 from pathlib import Path
 from typing import Dict
 
+import jinja2
 import uvicorn
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
-from app.core import config
+from app.core import config, http
 
 try:
     import webview  # type: ignore
@@ -33,13 +34,30 @@ except ModuleNotFoundError:
 BASE_PATH = Path(__file__).resolve().parent
 TEMPLATES = Jinja2Templates(directory=str(BASE_PATH / "templates"))
 
+# Templates never change post-ship: skip the per-request mtime check and
+# persist compiled templates so later starts load bytecode instead of
+# re-parsing the source.
+_JINJA_CACHE_DIR = config.CACHE_DIR / "jinja"
+_JINJA_CACHE_DIR.mkdir(exist_ok=True)
+TEMPLATES.env.auto_reload = False
+TEMPLATES.env.bytecode_cache = jinja2.FileSystemBytecodeCache(str(_JINJA_CACHE_DIR))
+
 app = FastAPI(
     title=config.APP_NAME,
     version=config.LAUNCHER_VERSION,
     docs_url=None,
     redoc_url=None,
+    default_response_class=ORJSONResponse,  # orjson is 3-5x faster than stdlib json
 )
 
+@app.on_event("startup")
+async def _open_http_session() -> None:
+    await http.get_session()
+
+@app.on_event("shutdown")
+async def _close_http_session() -> None:
+    await http.close_session()
+
 app.mount(
     "/static",
     StaticFiles(directory=str(BASE_PATH / "static"), html=False),
@@ -52,11 +70,32 @@ PAGE_CONTEXT: Dict[str, str] = {
     "launcher_version": config.LAUNCHER_VERSION,
 }
 
-@app.get("/login", response_class=HTMLResponse)
-async def page_login(request: Request):
-    return TEMPLATES.TemplateResponse(
-        "pages/login.html",
-        {"request": request, **PAGE_CONTEXT},
+def _static_page(template: str):
+    """Handler factory for pages that only need the shared context."""
+    async def _handler(request: Request):
+        return TEMPLATES.TemplateResponse(
+            template,
+            {"request": request, **PAGE_CONTEXT},
+        )
+    return _handler
+
+# every page except "/" (which injects last_server) is identical
+# boilerplate – register them from one table instead of seven copies
+_STATIC_PAGES: Dict[str, str] = {
+    "/login":     "pages/login.html",
+    "/settings":  "pages/settings.html",
+    "/servers":   "pages/serverlist.html",
+    "/local":     "pages/local.html",
+    "/adventure": "pages/adventure.html",   # "NEW ADVENTURE" Menüpunkt
+    "/avatar":    "pages/avatar.html",
+    "/loading":   "pages/loading.html",
+}
+for _route, _template in _STATIC_PAGES.items():
+    app.add_api_route(
+        _route,
+        _static_page(_template),
+        response_class=HTMLResponse,
+        include_in_schema=False,
     )
 
 @app.get("/", response_class=HTMLResponse)
@@ -73,54 +112,6 @@ async def page_index(request: Request):
         },
     )
 
-@app.get("/settings", response_class=HTMLResponse)
-async def page_settings(request: Request):
-    return TEMPLATES.TemplateResponse(
-        "pages/settings.html",
-        {"request": request, **PAGE_CONTEXT},
-    )
-
-@app.get("/servers", response_class=HTMLResponse)
-async def page_servers(request: Request):
-    return TEMPLATES.TemplateResponse(
-        "pages/serverlist.html",
-        {"request": request, **PAGE_CONTEXT},
-    )
-
-@app.get("/local", response_class=HTMLResponse)
-async def page_local(request: Request):
-    return TEMPLATES.TemplateResponse(
-        "pages/local.html",
-        {"request": request, **PAGE_CONTEXT},
-    )
-
-@app.get("/adventure", response_class=HTMLResponse)
-async def page_adventure(request: Request):
-    """
-    Create-/Manage-Worlds UI (“NEW ADVENTURE” Menüpunkt)
-    """
-    return TEMPLATES.TemplateResponse(
-        "pages/adventure.html",
-        {"request": request, **PAGE_CONTEXT},
-    )
-
-@app.get("/avatar", response_class=HTMLResponse)
-async def page_adventure(request: Request):
-    """
-    Create-/Manage-Worlds UI (“NEW ADVENTURE” Menüpunkt)
-    """
-    return TEMPLATES.TemplateResponse(
-        "pages/avatar.html",
-        {"request": request, **PAGE_CONTEXT},
-    )
-@app.get("/loading", response_class=HTMLResponse)
-async def page_loading(request: Request):
-    return TEMPLATES.TemplateResponse(
-        "pages/loading.html",
-        {"request": request, **PAGE_CONTEXT},
-    )
-
-
 # ────────────────────────────── API routers
 auth     = importlib.import_module("app.api.auth")
 servers  = importlib.import_module("app.api.servers")
@@ -144,8 +135,17 @@ def run_desktop(host: str = "127.0.0.1", port: int = 5050) -> None:
 
     _run_uvicorn_bg(host, port)
 
+    # Poll until Uvicorn actually accepts connections: a fixed sleep was
+    # both wasted time on fast machines and a race on slow ones.
+    import socket
     import time
-    time.sleep(0.8)                               # wait until Uvicorn is ready
+    deadline = time.monotonic() + 5.0
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.2):
+                break
+        except OSError:
+            time.sleep(0.02)
 
     start_url = f"http://{host}:{port}/login"
 